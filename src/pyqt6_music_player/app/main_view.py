@@ -26,6 +26,9 @@ from pyqt6_music_player.features import (
 APP_TITLE = "Music Player"
 APP_ICON = ASSETS_PATH / "mp_icon.svg"
 APP_DEFAULT_SIZE = (750, 750)
+MAIN_LAYOUT_MARGINS = (10, 10, 10, 10)  # (left, top, right, bottom) in pixels
+MAIN_LAYOUT_SPACING = 10
+PLAYERBAR_BOTTOM_LAYOUT_MARGINS = (10, 0, 10, 0)  # (left, top, right, bottom)
 
 logger = logging.getLogger(__name__)
 
@@ -91,7 +94,7 @@ class MusicPlayerView(QWidget):
 
     def _init_ui(self) -> None:
         # Setup instance widgets and layout
-        main_layout_vertical = QVBoxLayout()
+        main_layout_vertical = QVBoxLayout(self)
 
         # Top widget: Playlist manager
         main_layout_vertical.addWidget(self.playlist_manager_view, 0)
@@ -102,10 +105,8 @@ class MusicPlayerView(QWidget):
         # Bottom widget: Player bar
         main_layout_vertical.addWidget(self.player_bar_view, 0)
 
-        main_layout_vertical.setContentsMargins(10, 10, 10, 10)
-        main_layout_vertical.setSpacing(10)
-
-        self.setLayout(main_layout_vertical)
+        main_layout_vertical.setContentsMargins(*MAIN_LAYOUT_MARGINS)
+        main_layout_vertical.setSpacing(MAIN_LAYOUT_SPACING)
 
 
 # ==================== SECTION VIEWS ====================
@@ -130,12 +131,10 @@ class PlaylistManagerSection(QFrame):
 
     def _init_ui(self) -> None:
         # Setup instance widgets and layout
-        instance_layout = QVBoxLayout()
+        instance_layout = QVBoxLayout(self)
 
         instance_layout.addWidget(self._playlist_manager_panel)
 
-        self.setLayout(instance_layout)
-
 
 # --- Playlist ---
 class PlaylistSection(QFrame):
@@ -152,14 +151,12 @@ class PlaylistSection(QFrame):
     # -- Protected/internal methods --
     def _init_ui(self) -> None:
         # Setup instance widgets and layout
-        instance_layout = QVBoxLayout()
+        instance_layout = QVBoxLayout(self)
 
         instance_layout.addWidget(self._playlist_display)
 
         self.setObjectName("playlistSection")
 
-        self.setLayout(instance_layout)
-
 
 # --- Playerbar ---
 class PlayerbarSection(QFrame):
@@ -187,7 +184,7 @@ class PlayerbarSection(QFrame):
     # -- Protected/internal methods --
     def _init_ui(self):
         # Setup instance widgets and layout
-        main_layout_vertical = QVBoxLayout()
+        main_layout_vertical = QVBoxLayout(self)
 
         # Top section: Playback progress panel
         top_layout = QVBoxLayout()
@@ -208,12 +205,10 @@ class PlayerbarSection(QFrame):
         # Bottom section right widget: Volume controls panel
         bottom_layout_horizontal.addWidget(self._volume_controls_panel, 0)
 
-        bottom_layout_horizontal.setContentsMargins(10, 0, 10, 0)
+        bottom_layout_horizontal.setContentsMargins(*PLAYERBAR_BOTTOM_LAYOUT_MARGINS)
 
         main_layout_vertical.addLayout(top_layout)
         main_layout_vertical.addLayout(bottom_layout_horizontal)
 
         self.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Raised)
         self.setObjectName("playerBarSection")
-
-        self.setLayout(main_layout_vertical)
@@ -1,6 +1,6 @@
 import logging
 
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QApplication
 
 from pyqt6_music_player.core import Shutdownable, ShutdownStage
@@ -53,6 +53,7 @@ class ShutdownHandler(QObject):
         # If normal shutdown hasn't completed in time, escalate to force quit.
         QTimer.singleShot(TIMEOUT_DURATION_IN_MS, self._escalate_to_force_quit)
 
+    @pyqtSlot()
     def _escalate_to_force_quit(self):
         # Normal shutdown already completed (thread deleted) - nothing to escalate.
         if not self._audio_player.has_thread:
@@ -74,6 +75,7 @@ class ShutdownHandler(QObject):
         # If force quit hasn't completed in time, escalate to a forced terminate.
         QTimer.singleShot(TIMEOUT_DURATION_IN_MS, self._escalate_to_terminate)
 
+    @pyqtSlot()
     def _escalate_to_terminate(self):
         # Force quit already completed (thread deleted) - nothing to escalate.
         if not self._audio_player.has_thread:
@@ -96,6 +98,7 @@ class ShutdownHandler(QObject):
 
         QTimer.singleShot(TIMEOUT_DURATION_IN_MS, self._force_close_application)
 
+    @pyqtSlot()
     def _force_close_application(self):
         # Guarantees the app will exit even if terminating audio-player thread never
         # produced a `finished` signal (and thus `_on_thread_deleted` never fired).
@@ -119,6 +122,7 @@ class ShutdownHandler(QObject):
         if app is not None:
             app.quit()
 
+    @pyqtSlot()
     def _on_thread_deleted(self) -> None:
         if self._stage == ShutdownStage.DONE:
             return
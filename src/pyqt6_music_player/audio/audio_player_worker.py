@@ -7,6 +7,9 @@ from PyQt6.QtCore import Q_ARG, QMetaObject, QObject, Qt, pyqtSignal, pyqtSlot
 from pyqt6_music_player.core import PlaybackState
 from pyqt6_music_player.track import AudioPCM
 
+ACTIVE_PLAYBACK_STATES = frozenset({PlaybackState.PLAYING, PlaybackState.PAUSED})
+INACTIVE_PLAYBACK_STATES = frozenset({PlaybackState.IDLE, PlaybackState.STOPPED})
+
 logger = logging.getLogger(__name__)
 
 
@@ -203,7 +206,7 @@ class AudioPlayerWorker(QObject):
         state = self._state
 
         # PLAYBACK STATE SET TO 'STOPPED' - end callback
-        if start > 0 and state in {PlaybackState.IDLE, PlaybackState.STOPPED}:
+        if start > 0 and state in INACTIVE_PLAYBACK_STATES:
             return None, paComplete
 
         # PLAYBACK STATE SET TO 'PAUSED' - feed silence bytes
@@ -281,7 +284,7 @@ class AudioPlayerWorker(QObject):
         logger.info("Playback started.")
 
     def _stop_playback(self) -> None:
-        if self._state in {PlaybackState.PLAYING, PlaybackState.PAUSED}:
+        if self._state in ACTIVE_PLAYBACK_STATES:
             self._set_playback_state(PlaybackState.STOPPED)
 
             logger.info("Playback stopped.")
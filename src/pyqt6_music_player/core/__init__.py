@@ -9,7 +9,8 @@ from .playback_order_events import (
 )
 from .protocols import PlaybackOrderProtocol, PlaylistServiceProtocol, Shutdownable
 from .signals import Signal
-from .widgets import IconButton
+from .throttle import LatestValueThrottle
+from .widgets import IconButton, load_icon
 
 __all__ = [
     # config.py
@@ -42,6 +43,10 @@ __all__ = [
     # signal.py
     "Signal",
 
+    # throttle.py
+    "LatestValueThrottle",
+
     # widgets.py
     "IconButton",
+    "load_icon",
 ]
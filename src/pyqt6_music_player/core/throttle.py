@@ -0,0 +1,71 @@
+from typing import Any
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+
+
+class LatestValueThrottle(QObject):
+    """Forward only the latest pushed value, at most once per interval.
+
+    The first `push` starts a single-shot timer; values pushed before it fires
+    replace the pending one. When the timer fires, the pending value is emitted
+    through `flushed`.
+    """
+
+    flushed = pyqtSignal(object)
+
+    def __init__(self, interval_ms: int, parent: QObject | None = None):
+        """Initialize LatestValueThrottle.
+
+        Args:
+            interval_ms: Minimum time between two `flushed` emissions, in
+                milliseconds.
+            parent: Optional Qt parent that owns the throttle.
+
+        """
+        super().__init__(parent)
+        # State
+        self._pending_value: Any = None
+        self._has_pending = False
+
+        # Timer
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    # -- Public methods --
+    def push(self, value: Any) -> None:
+        """Store `value` as the pending value, sent when the interval ends.
+
+        Args:
+            value: The latest value, replacing any value still pending.
+
+        """
+        self._pending_value = value
+        self._has_pending = True
+
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @pyqtSlot()
+    def flush(self) -> None:
+        """Emit the pending value right away, if there is one."""
+        self._timer.stop()
+
+        if not self._has_pending:
+            return
+
+        value = self._pending_value
+        self._clear_pending()
+
+        self.flushed.emit(value)
+
+    def cancel(self) -> None:
+        """Drop the pending value without emitting it."""
+        self._timer.stop()
+        self._clear_pending()
+
+    # -- Protected/internal methods --
+    def _clear_pending(self) -> None:
+        self._pending_value = None
+        self._has_pending = False
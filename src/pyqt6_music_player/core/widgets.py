@@ -1,4 +1,5 @@
 import logging
+from functools import cache
 from pathlib import Path
 
 from PyQt6.QtCore import QSize
@@ -8,6 +9,23 @@ from PyQt6.QtWidgets import QPushButton
 logger = logging.getLogger(__name__)
 
 
+@cache
+def load_icon(icon_path: Path) -> QIcon:
+    """Load a QIcon from the given path, reading and decoding the file only once.
+
+    Args:
+        icon_path: Path to the icon file.
+
+    Returns:
+        The QIcon shared by every caller that asks for `icon_path`.
+
+    """
+    if not icon_path.exists():
+        logger.warning("Icon path not found: %s", icon_path)
+
+    return QIcon(str(icon_path))
+
+
 class IconButton(QPushButton):
     """A reusable QPushButton with a custom icon and fixed dimensions."""
 
@@ -33,12 +51,7 @@ class IconButton(QPushButton):
 
     def _configure_properties(self) -> None:
         # Configure instance properties
-        if not self._icon_path.exists():
-            logging.warning("Icon path not found: %s", self._icon_path)
-
-        qicon = QIcon(str(self._icon_path))
-
-        self.setIcon(qicon)
+        self.setIcon(load_icon(self._icon_path))
         self.setIconSize(QSize(*self._icon_size))
         self.setFixedSize(*self._widget_size)
 
@@ -1,8 +1,14 @@
-from PyQt6.QtCore import Qt, pyqtSlot
-from PyQt6.QtGui import QIcon, QImage
+from PyQt6.QtCore import QSignalBlocker, Qt, pyqtSlot
+from PyQt6.QtGui import QImage
 from PyQt6.QtWidgets import QHBoxLayout, QLabel, QSlider, QVBoxLayout, QWidget
 
-from pyqt6_music_player.core import ASSETS_PATH, IconButton, PlaybackState, RepeatMode
+from pyqt6_music_player.core import (
+    ASSETS_PATH,
+    IconButton,
+    LatestValueThrottle,
+    PlaybackState,
+    load_icon,
+)
 
 from .playback_viewmodel import PlaybackViewModel
 from .playback_widgets import AlbumArtLabel, MarqueeLabel, RepeatButton, ShuffleButton
@@ -16,6 +22,8 @@ PRIMARY_PLAYBACK_CONTROL_BTN_SIZE = (40, 40)
 PRIMARY_PLAYBACK_CONTROL_BTN_ICON_SIZE = (20, 20)
 SECONDARY_PLAYBACK_CONTROL_BTN_SIZE = (30, 30)
 SECONDARY_PLAYBACK_CONTROL_BTN_ICON_SIZE = (15, 15)
+PLAYBACK_PANEL_LAYOUT_SPACING = 10
+SEEK_THROTTLE_INTERVAL_MS = 16  # Max rate of seek requests sent while dragging
 
 
 # ==================== PANELS ====================
@@ -59,6 +67,11 @@ class PlaybackControlsPanel(QWidget):
         )
         self.repeat_button = RepeatButton()
 
+        # Play-pause icons, resolved once here (a QApplication exists by now) so
+        # state changes only swap between the two
+        self._play_icon = load_icon(PLAY_ICON)
+        self._pause_icon = load_icon(PAUSE_ICON)
+
         # Setup
         self._init_ui()
         self._connect_signals()
@@ -68,77 +81,67 @@ class PlaybackControlsPanel(QWidget):
         # Setup instance widgets and layout
         #
         # PANEL LAYOUT: Horizontal box
-        main_layout_horizontal = QHBoxLayout()
-
-        # LEFT WIDGETS: Shuffle and previous buttons
-        main_layout_horizontal.addWidget(self.shuffle_button)
-        main_layout_horizontal.addWidget(self.previous_button)
+        main_layout_horizontal = QHBoxLayout(self)
 
-        # MIDDLE WIDGET: Play-pause button
-        main_layout_horizontal.addWidget(self.play_pause_button)
+        # WIDGETS (left to right): Shuffle and previous buttons, play-pause button,
+        # next and repeat buttons
+        for button in (
+                self.shuffle_button,
+                self.previous_button,
+                self.play_pause_button,
+                self.next_button,
+                self.repeat_button,
+        ):
+            main_layout_horizontal.addWidget(button)
 
-        # RIGHT WIDGETS: Next and repeat buttons
-        main_layout_horizontal.addWidget(self.next_button)
-        main_layout_horizontal.addWidget(self.repeat_button)
+        main_layout_horizontal.setSpacing(PLAYBACK_PANEL_LAYOUT_SPACING)
 
-        main_layout_horizontal.setSpacing(10)
-
-        self.setLayout(main_layout_horizontal)
         self.setDisabled(True)
 
     def _connect_signals(self) -> None:
         # PlaybackControlsPanel -> PlaybackViewModel
-        self.shuffle_button.change_shuffle_mode_request.connect(
-            self._on_shuffle_mode_change_requested,
-        )
-        self.previous_button.clicked.connect(self._on_previous_button_clicked)
-        self.play_pause_button.clicked.connect(self._on_play_pause_button_clicked)
-        self.next_button.clicked.connect(self._on_next_button_clicked)
-        self.repeat_button.change_repeat_mode_request.connect(
-            self._on_repeat_mode_change_request,
-        )
+        #
+        # Connected straight to the viewmodel, there is nothing for the panel to do
+        # in between
+        viewmodel = self._viewmodel
+        for signal, slot in (
+                (
+                    self.shuffle_button.change_shuffle_mode_request,
+                    viewmodel.set_shuffle_enabled,
+                ),
+                (self.previous_button.clicked, viewmodel.previous_track),
+                (self.play_pause_button.clicked, viewmodel.toggle_playback),
+                (self.next_button.clicked, viewmodel.next_track),
+                (
+                    self.repeat_button.change_repeat_mode_request,
+                    viewmodel.set_repeat_mode,
+                ),
+        ):
+            signal.connect(slot)
 
         # PlaybackViewModel -> PlaybackControlsPanel
         self._viewmodel.initial_tracks_added.connect(self._on_initial_track_add)
         self._viewmodel.playback_state_changed.connect(self._on_player_state_changed)
 
-    @pyqtSlot(bool)
-    def _on_shuffle_mode_change_requested(self, enabled: bool) -> None:
-        self._viewmodel.set_shuffle_enabled(enabled)
-
-    @pyqtSlot()
-    def _on_previous_button_clicked(self) -> None:
-        self._viewmodel.previous_track()
-
-    @pyqtSlot()
-    def _on_play_pause_button_clicked(self) -> None:
-        self._viewmodel.toggle_playback()
-
-    @pyqtSlot()
-    def _on_next_button_clicked(self) -> None:
-        self._viewmodel.next_track()
-
-    @pyqtSlot(RepeatMode)
-    def _on_repeat_mode_change_request(self, repeat_mode: RepeatMode) -> None:
-        self._viewmodel.set_repeat_mode(repeat_mode)
-
     @pyqtSlot()
     def _on_initial_track_add(self) -> None:
         # Enable the panel on initial track add to allow playback operations because
         # the panel is disabled by default on app start.
-        if not self.isEnabled():
-            self.setEnabled(True)
+        self.setEnabled(True)
+
+        # Only the first emission matters, see `PlaybackViewModel.enable_playback_ui`
+        self._viewmodel.initial_tracks_added.disconnect(self._on_initial_track_add)
 
     @pyqtSlot(PlaybackState)
     def _on_player_state_changed(self, player_state: PlaybackState) -> None:
         # Update play-pause button icon to reflect the current playback state.
         icon = (
-            PAUSE_ICON
+            self._pause_icon
             if player_state == PlaybackState.PLAYING
-            else PLAY_ICON
+            else self._play_icon
         )
 
-        self.play_pause_button.setIcon(QIcon(str(icon)))
+        self.play_pause_button.setIcon(icon)
 
 
 # --- PLAYBACK PROGRESS ---
@@ -165,6 +168,13 @@ class PlaybackProgressPanel(QWidget):
         self.seek_bar = QSlider()
         self.time_remaining_label = QLabel()
 
+        # Last text shown by each time label
+        self._elapsed_time_text: str | None = None
+        self._time_remaining_text: str | None = None
+
+        # Seek throttle, dragging the seek bar moves it on every pixel
+        self._seek_throttle = LatestValueThrottle(SEEK_THROTTLE_INTERVAL_MS, self)
+
         # Setup
         self._init_ui()
         self._connect_signals()
@@ -177,54 +187,55 @@ class PlaybackProgressPanel(QWidget):
         default_duration = self._viewmodel.active_track_formatted_duration
 
         # PANEL LAYOUT: Horizontal box
-        main_layout_horizontal = QHBoxLayout()
+        main_layout_horizontal = QHBoxLayout(self)
 
         # LEFT WIDGET: Elapsed time label
-        self.elapsed_time_label.setText(default_duration)
-
-        main_layout_horizontal.addWidget(self.elapsed_time_label)
+        self._set_elapsed_time_text(default_duration)
 
         # MIDDLE WIDGET: Seek bar
         self.seek_bar.setOrientation(Qt.Orientation.Horizontal)
 
-        main_layout_horizontal.addWidget(self.seek_bar)
-
         # RIGHT WIDGET: Time remaining label
-        self.time_remaining_label.setText(default_duration)
+        self._set_time_remaining_text(default_duration)
 
-        main_layout_horizontal.addWidget(self.time_remaining_label)
+        for widget in (
+                self.elapsed_time_label,
+                self.seek_bar,
+                self.time_remaining_label,
+        ):
+            main_layout_horizontal.addWidget(widget)
 
-        main_layout_horizontal.setSpacing(10)
+        main_layout_horizontal.setSpacing(PLAYBACK_PANEL_LAYOUT_SPACING)
 
-        self.setLayout(main_layout_horizontal)
         self.setDisabled(True)
 
     def _connect_signals(self) -> None:
         # PlaybackProgressPanel -> PlaybackViewModel
-        self.seek_bar.sliderPressed.connect(self._on_slider_pressed)
-        self.seek_bar.sliderMoved.connect(self._on_slider_moved)
+        self.seek_bar.sliderPressed.connect(self._viewmodel.begin_seek)
+        self.seek_bar.sliderMoved.connect(self._seek_throttle.push)
         self.seek_bar.sliderReleased.connect(self._on_slider_released)
 
+        # Seek throttle -> PlaybackProgressPanel
+        self._seek_throttle.flushed.connect(self._on_seek_throttled)
+
         # PlaybackViewModel -> PlaybackProgressPanel
         self._viewmodel.playback_started.connect(self._on_playback_started)
         self._viewmodel.playback_position_changed.connect(
             self._on_playback_position_changed,
         )
-        self._viewmodel.initial_tracks_added.connect(
-            self._on_initial_track_added,
-        )
+        self._viewmodel.initial_tracks_added.connect(self._on_initial_track_added)
         self._viewmodel.playback_cleared.connect(self._on_playback_cleared)
 
-    @pyqtSlot()
-    def _on_slider_pressed(self) -> None:
-        self._viewmodel.begin_seek()
-
-    @pyqtSlot()
-    def _on_slider_moved(self) -> None:
-        self._viewmodel.seek(self.seek_bar.value())
+    @pyqtSlot(object)
+    def _on_seek_throttled(self, position: int) -> None:
+        # `flushed` carries a plain object, `seek` is an int slot
+        self._viewmodel.seek(int(position))
 
     @pyqtSlot()
     def _on_slider_released(self) -> None:
+        # The final position is applied by `end_seek`, drop any throttled one
+        self._seek_throttle.cancel()
+
         self._viewmodel.end_seek(self.seek_bar.value())
 
     @pyqtSlot(str, str, QImage, int, str)
@@ -239,7 +250,7 @@ class PlaybackProgressPanel(QWidget):
         # Set the progress bar range based on the total duration in milliseconds
         # to match the full track duration and for smooth, and precise seeking.
         self.seek_bar.setRange(0, duration_in_ms)
-        self.time_remaining_label.setText(formatted_duration)
+        self._set_time_remaining_text(formatted_duration)
 
     @pyqtSlot(int, str, str)
     def _on_playback_position_changed(
@@ -249,26 +260,45 @@ class PlaybackProgressPanel(QWidget):
             formatted_time_remaining: str,
     ) -> None:
         # Keep the slider and time labels in sync with the actual playback progress
-        self.seek_bar.blockSignals(True)
-        self.seek_bar.setValue(elapsed_time_in_ms)
-        self.seek_bar.blockSignals(False)
+        if elapsed_time_in_ms != self.seek_bar.value():
+            with QSignalBlocker(self.seek_bar):
+                self.seek_bar.setValue(elapsed_time_in_ms)
 
-        self.elapsed_time_label.setText(formatted_elapsed_time)
-        self.time_remaining_label.setText(formatted_time_remaining)
+        self._set_elapsed_time_text(formatted_elapsed_time)
+        self._set_time_remaining_text(formatted_time_remaining)
 
     @pyqtSlot()
     def _on_initial_track_added(self) -> None:
         # Enable the panel on initial track add to allow seek operation.
         # Note: The panel is disabled by default on app startup.
-        if not self.isEnabled():
-            self.setEnabled(True)
+        self.setEnabled(True)
+
+        # Only the first emission matters, see `PlaybackViewModel.enable_playback_ui`
+        self._viewmodel.initial_tracks_added.disconnect(self._on_initial_track_added)
 
     @pyqtSlot(str, str, str)
     def _on_playback_cleared(self, _title, _artist, formatted_duration: str):
         self.seek_bar.setValue(0)
 
-        self.elapsed_time_label.setText(formatted_duration)
-        self.time_remaining_label.setText(formatted_duration)
+        self._set_elapsed_time_text(formatted_duration)
+        self._set_time_remaining_text(formatted_duration)
+
+    def _set_elapsed_time_text(self, text: str) -> None:
+        # The formatted time only changes once per second, skip the redundant updates
+        # in between
+        if text == self._elapsed_time_text:
+            return
+
+        self._elapsed_time_text = text
+        self.elapsed_time_label.setText(text)
+
+    def _set_time_remaining_text(self, text: str) -> None:
+        # Same as `_set_elapsed_time_text`
+        if text == self._time_remaining_text:
+            return
+
+        self._time_remaining_text = text
+        self.time_remaining_label.setText(text)
 
 
 class NowPlayingPanel(QWidget):
@@ -307,7 +337,7 @@ class NowPlayingPanel(QWidget):
         default_artist = self._viewmodel.active_track_artist
 
         # PANEL LAYOUT: Horizontal box
-        panel_layout = QHBoxLayout()
+        panel_layout = QHBoxLayout(self)
 
         # LEFT WIDGET: Album art
         panel_layout.addWidget(self.album_art)
@@ -324,9 +354,8 @@ class NowPlayingPanel(QWidget):
 
         panel_layout.addLayout(right_section_vertical)
 
-        self.setLayout(panel_layout)
-
     def _connect_signals(self) -> None:
+        # PlaybackViewModel -> NowPlayingPanel
         self._viewmodel.playback_started.connect(self._on_playback_started)
         self._viewmodel.playback_cleared.connect(self._on_playback_cleared)
 
@@ -1,7 +1,7 @@
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QImage
 
-from pyqt6_music_player.core import PlaybackState, RepeatMode
+from pyqt6_music_player.core import LatestValueThrottle, PlaybackState, RepeatMode
 from pyqt6_music_player.utils import format_duration
 
 from .playback_service import PlaybackService
@@ -10,6 +10,7 @@ from .playback_service import PlaybackService
 DEFAULT_TITLE = "Track Title"
 DEFAULT_ARTIST = "Track Artist"
 DEFAULT_DURATION = 0.0
+POSITION_UI_INTERVAL_MS = 100  # Max rate of position updates forwarded to the view
 
 
 # ==================== VIEWMODEL ====================
@@ -39,6 +40,12 @@ class PlaybackViewModel(QObject):
         self._active_track_duration: float = DEFAULT_DURATION
         self._pre_seek_playback_state: PlaybackState | None = None
 
+        # Position update throttle
+        #
+        # The audio worker reports the position on every buffer (~40 Hz), far more
+        # often than the view can visibly change.
+        self._position_throttle = LatestValueThrottle(POSITION_UI_INTERVAL_MS, self)
+
         # Setup
         self._connect_signals()
 
@@ -58,16 +65,20 @@ class PlaybackViewModel(QObject):
         """The active track's duration in 'hh:mm:ss' format."""
         return format_duration(self._active_track_duration)
 
+    @pyqtSlot()
     def toggle_playback(self) -> None:
         """Toggle between playing and paused state."""
         self._service.toggle_playback()
 
+    @pyqtSlot()
     def next_track(self) -> None:
         self._service.next_track()
 
+    @pyqtSlot()
     def previous_track(self) -> None:
         self._service.previous_track()
 
+    @pyqtSlot()
     def begin_seek(self) -> None:
         """Begin seek operation, pausing playback if currently playing."""
         status = self._service.playback_state
@@ -77,6 +88,7 @@ class PlaybackViewModel(QObject):
         if status == PlaybackState.PLAYING:
             self._service.pause()
 
+    @pyqtSlot(int)
     def seek(self, current_position: int) -> None:
         """Seek to the given position during an active seek operation.
 
@@ -100,6 +112,7 @@ class PlaybackViewModel(QObject):
 
         self._pre_seek_playback_state = None
 
+    @pyqtSlot(bool)
     def set_shuffle_enabled(self, enabled: bool) -> None:
         """Enable or disable shuffle mode.
 
@@ -109,6 +122,7 @@ class PlaybackViewModel(QObject):
         """
         self._service.set_shuffle_enabled(enabled)
 
+    @pyqtSlot(RepeatMode)
     def set_repeat_mode(self, repeat_mode: RepeatMode) -> None:
         """Set the repeat mode.
 
@@ -119,6 +133,12 @@ class PlaybackViewModel(QObject):
         self._service.set_repeat_mode(repeat_mode)
 
     def enable_playback_ui(self) -> None:
+        """Enable the playback panels when tracks are added to an empty playlist.
+
+        `initial_tracks_added` fires every time the playlist goes from empty to
+        non-empty. The panels start disabled and are never disabled again, so they
+        only need the first emission and disconnect after handling it.
+        """
         self.initial_tracks_added.emit()
 
     # -- Protected/internal methods --
@@ -131,12 +151,21 @@ class PlaybackViewModel(QObject):
         )
         self._service.playback_cleared.connect(self._on_playback_cleared)
 
+        # Position update throttle -> PlaybackViewModel
+        self._position_throttle.flushed.connect(self._emit_playback_position)
+
     def _reset_state(self) -> None:
         self._active_track_title= DEFAULT_TITLE
         self._active_track_artist = DEFAULT_ARTIST
         self._active_track_duration = DEFAULT_DURATION
 
+    def _discard_pending_position(self) -> None:
+        # Drop a throttled position that belongs to the previous playback
+        self._position_throttle.cancel()
+
     def _on_playback_started(self) -> None:
+        self._discard_pending_position()
+
         current_track = self._service.current_track
 
         # Avoid redundant UI updates if the active track did not change e.g. replay or
@@ -168,6 +197,10 @@ class PlaybackViewModel(QObject):
         self._active_track_duration = current_track.duration
 
     def _on_playback_position_changed(self, elapsed_time_in_seconds: float) -> None:
+        self._position_throttle.push(elapsed_time_in_seconds)
+
+    @pyqtSlot(object)
+    def _emit_playback_position(self, elapsed_time_in_seconds: float) -> None:
         # Convert and emit elapsed time into milliseconds and formatted duration
         elapsed_time_in_ms = int(elapsed_time_in_seconds * 1000)
         time_remaining = int(self._active_track_duration - elapsed_time_in_seconds)
@@ -181,6 +214,7 @@ class PlaybackViewModel(QObject):
         )
 
     def _on_playback_cleared(self) -> None:
+        self._discard_pending_position()
         self._reset_state()
 
         self.playback_cleared.emit(
@@ -1,11 +1,11 @@
 from pathlib import Path
 from typing import ClassVar
 
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QIcon, QPainter, QPaintEvent, QPixmap, QImage
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QPainter, QPaintEvent, QPixmap, QImage
 from PyQt6.QtWidgets import QLabel
 
-from pyqt6_music_player.core import ASSETS_PATH, IconButton, RepeatMode
+from pyqt6_music_player.core import ASSETS_PATH, IconButton, RepeatMode, load_icon
 
 # ==================== CONSTANTS ====================
 ALBUM_ART_PLACEHOLDER = ASSETS_PATH / "default_art.png"
@@ -26,6 +26,9 @@ class AlbumArtLabel(QLabel):
 
     def __init__(self):
         super().__init__()
+        # Placeholder pixmap, loaded and scaled on first use only
+        self._placeholder_pixmap: QPixmap | None = None
+
         # Setup
         self._configure_properties()
         self._init_ui()
@@ -59,20 +62,28 @@ class AlbumArtLabel(QLabel):
     def _render_image(self, image: QImage) -> None:
         # Render placeholder image when the given QImage is null
         # (no art, or corrupted/unparseable art)
-        pixmap = (
-            QPixmap(str(ALBUM_ART_PLACEHOLDER))
-            if image.isNull()
-            else QPixmap.fromImage(image)
-        )
+        if image.isNull():
+            self.setPixmap(self._get_placeholder_pixmap())
+            return
+
+        self.setPixmap(self._scale_to_label(QPixmap.fromImage(image)))
 
-        scaled = pixmap.scaled(
+    def _get_placeholder_pixmap(self) -> QPixmap:
+        # The label has a fixed size, so the scaled placeholder never changes and is
+        # read from disk and scaled only once
+        if self._placeholder_pixmap is None:
+            placeholder = QPixmap(str(ALBUM_ART_PLACEHOLDER))
+            self._placeholder_pixmap = self._scale_to_label(placeholder)
+
+        return self._placeholder_pixmap
+
+    def _scale_to_label(self, pixmap: QPixmap) -> QPixmap:
+        return pixmap.scaled(
             self.size(),
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation,
         )
 
-        self.setPixmap(scaled)
-
 
 class MarqueeLabel(QLabel):
     """Custom QLabel for displaying track metadata."""
@@ -153,6 +164,7 @@ class MarqueeLabel(QLabel):
         self.setFixedSize(*self._widget_size)
         self.setObjectName(self._object_name)
 
+    @pyqtSlot()
     def _update_offset(self) -> None:
         # Compute and update text offset based on the current text position
         text_width = self.fontMetrics().horizontalAdvance(self.text())
@@ -209,6 +221,7 @@ class ShuffleButton(IconButton):
         self.toggled.connect(self._on_toggle)
 
     # -- Protected/Internal methods --
+    @pyqtSlot(bool)
     def _on_toggle(self, checked: bool) -> None:
         self.change_shuffle_mode_request.emit(checked)
 
@@ -218,7 +231,7 @@ class ShuffleButton(IconButton):
         # Update icon based on the current shuffle mode
         icon = (SHUFFLE_DISABLED_ICON if checked else SHUFFLE_ICON)
 
-        self.setIcon(QIcon(str(icon)))
+        self.setIcon(load_icon(icon))
 
 
 class RepeatButton(IconButton):
@@ -259,6 +272,7 @@ class RepeatButton(IconButton):
         self.clicked.connect(self._on_clicked)
 
     # -- Protected/Internal methods --
+    @pyqtSlot()
     def _on_clicked(self) -> None:
         # Cycle and emit shuffle mode
         self._mode_idx = (self._mode_idx + 1) % len(self.MODES)
@@ -278,7 +292,7 @@ class RepeatButton(IconButton):
         else:
             icon = REPEAT_ICON
 
-        self.setIcon(QIcon(str(icon)))
+        self.setIcon(load_icon(icon))
 
         # Change the toggle state only if current state != new state
         toggle_state = repeat_mode in {RepeatMode.ONE, RepeatMode.ALL}
@@ -68,7 +68,7 @@ class PlaylistManagerPanel(QWidget):
         # Setup instance widgets and layout
         #
         # PANEL LAYOUT: Horizontal box
-        panel_layout = QHBoxLayout()
+        panel_layout = QHBoxLayout(self)
 
         # LEFT WIDGET: Add track button
         panel_layout.addWidget(self._add_track_btn)
@@ -83,12 +83,12 @@ class PlaylistManagerPanel(QWidget):
             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignCenter,
         )
 
-        self.setLayout(panel_layout)
-
     def _connect_signals(self) -> None:
         # PlaylistManagerPanel widgets -> PlaylistViewModel
         self._add_track_btn.clicked.connect(self._on_add_track_button_clicked)
-        self._remove_track_btn.clicked.connect(self._on_remove_track_button_clicked)
+        self._remove_track_btn.clicked.connect(
+            self._playlist_viewmodel.remove_selected_track,
+        )
 
         # TODO: Implement load folder
 
@@ -108,10 +108,6 @@ class PlaylistManagerPanel(QWidget):
 
         self._playlist_viewmodel.add_selected_tracks(file_paths)
 
-    @pyqtSlot()
-    def _on_remove_track_button_clicked(self) -> None:
-        self._playlist_viewmodel.remove_selected_track()
-
 
 # --- PLAYLIST ---
 class PlaylistDisplayPanel(QWidget):
@@ -146,13 +142,11 @@ class PlaylistDisplayPanel(QWidget):
         # Setup instance widgets and layout
         #
         # PANEL LAYOUT: Vertical box
-        panel_layout = QVBoxLayout()
+        panel_layout = QVBoxLayout(self)
 
         # WIDGET: Playlist table (QTableView)
         panel_layout.addWidget(self._playlist_widget)
 
-        self.setLayout(panel_layout)
-
     def _connect_signals(self) -> None:
         # PlaylistDisplayPanel -> PlaylistViewModel
         self.selection_model.currentRowChanged.connect(self._on_row_selection_changed)
@@ -179,9 +173,8 @@ class PlaylistDisplayPanel(QWidget):
 
     @pyqtSlot()
     def _on_display_order_changed(self) -> None:
-        # Reset row selection when display order changes
-        self.selection_model.clearSelection()
-        self.selection_model.clearCurrentIndex()
+        # Reset row selection and current index in one pass when display order changes
+        self.selection_model.clear()
 
     @pyqtSlot(int)
     def _on_playback_order_position_changed(self, index_position: int) -> None:
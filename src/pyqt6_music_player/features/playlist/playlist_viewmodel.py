@@ -1,7 +1,7 @@
 from collections.abc import Sequence
 from typing import ClassVar
 
-from PyQt6.QtCore import QAbstractTableModel, Qt, pyqtSignal
+from PyQt6.QtCore import QAbstractTableModel, Qt, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QMessageBox
 
 from pyqt6_music_player.core import (
@@ -13,7 +13,11 @@ from pyqt6_music_player.utils import format_duration
 
 from .playlist_service import PlaylistService
 
+# ==================== CONSTANTS ====================
+DURATION_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignCenter
 
+
+# ==================== VIEWMODEL ====================
 class PlaylistViewModel(QAbstractTableModel):
     """Expose playlist tracks as a table model for the playlist view."""
 
@@ -23,6 +27,12 @@ class PlaylistViewModel(QAbstractTableModel):
         ("album", "Album"),
         ("duration", "Duration"),
     )  # Column name, Actual column
+    HEADER_LABELS: ClassVar[tuple[str, ...]] = tuple(
+        label for _, label in PLAYLIST_COLUMN
+    )
+    DURATION_COLUMN: ClassVar[int] = [
+        name for name, _ in PLAYLIST_COLUMN
+    ].index("duration")
 
     display_order_changed = pyqtSignal()
     active_track_position_changed = pyqtSignal(int)
@@ -40,6 +50,12 @@ class PlaylistViewModel(QAbstractTableModel):
 
         # Playlist UI state
         self._display_order: list[int] | None = []
+
+        # Display strings in display order, one list per column
+        # (`self._display_columns[column][row]`), rebuilt with the display order
+        self._display_columns: tuple[list[str], ...] = tuple(
+            [] for _ in self.PLAYLIST_COLUMN
+        )
         self._active_row: int | None = None
         self._selected_row: int | None = None
 
@@ -56,6 +72,7 @@ class PlaylistViewModel(QAbstractTableModel):
         """
         self._playlist_service.add_tracks_from_paths(paths)
 
+    @pyqtSlot()
     def remove_selected_track(self) -> None:
         """Remove the selected track from playlist."""
         if not self._can_remove_selected_track():
@@ -91,42 +108,37 @@ class PlaylistViewModel(QAbstractTableModel):
         return len(self.PLAYLIST_COLUMN)
 
     def data(self, index, role=...):
-        # Provides cell data for display and alignment roles
-        if not index.isValid():
-            return None
-
-        row = index.row()
-        column_name = self.PLAYLIST_COLUMN[index.column()][0]
-        track_index = self._display_order[row]
-
+        # Provides cell data for display and alignment roles.
+        #
+        # The view asks for several roles per painted cell, so unhandled roles are
+        # rejected before any index or track lookup
         if role == Qt.ItemDataRole.DisplayRole:
-            track = self._playlist_service.get_track_by_index(track_index)
-            if column_name == "duration":
-                return format_duration(track.duration)
-            return getattr(track, column_name)
+            if not index.isValid():
+                return None
+
+            return self._display_columns[index.column()][index.row()]
 
-        if role == Qt.ItemDataRole.TextAlignmentRole and column_name == "duration":
-            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            is_duration_column = (
+                    index.isValid()
+                    and index.column() == self.DURATION_COLUMN
+            )
+            return DURATION_ALIGNMENT if is_duration_column else None
 
         return None
 
     def headerData(self, section, orientation, role=...):
-        # Provides header label and alignment for horizontal headers
-        column = self.PLAYLIST_COLUMN[section][1]
-        is_column_field = (
-                role == Qt.ItemDataRole.DisplayRole
-                and orientation == Qt.Orientation.Horizontal
-        )
-        is_duration_column = (
-                role == Qt.ItemDataRole.TextAlignmentRole
-                and column == "Duration"
-        )
+        # Provides header label and alignment for horizontal headers.
+        #
+        # Only the horizontal header has labels, vertical sections are rows
+        if orientation != Qt.Orientation.Horizontal:
+            return None
 
-        if is_column_field:
-            return column
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADER_LABELS[section]
 
-        if is_duration_column:
-            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return DURATION_ALIGNMENT if section == self.DURATION_COLUMN else None
 
         return None
 
@@ -141,13 +153,13 @@ class PlaylistViewModel(QAbstractTableModel):
 
     def _on_tracks_added(self, state: TracksAddedEvent) -> None:
         # Update the display order
-        self._update_display_order(state.order)
+        self._update_display_order(state.order, row_count_changed=True)
 
         self._update_active_row(state.position)
 
     def _on_track_removed(self, state: TrackRemovedEvent) -> None:
         # Update the display order
-        self._update_display_order(state.order)
+        self._update_display_order(state.order, row_count_changed=True)
 
         self._update_active_row(state.position)
 
@@ -158,16 +170,45 @@ class PlaylistViewModel(QAbstractTableModel):
         # Ensure active track == active row after the display update
         self._update_active_row(result.position)
 
-    def _update_display_order(self, display_order: list[int]) -> None:
-        # Update the display order, and mode
-        self.layoutAboutToBeChanged.emit()
+    def _update_display_order(
+            self,
+            display_order: list[int],
+            *,
+            row_count_changed: bool = False,
+    ) -> None:
+        # Update the display order, and mode.
+        #
+        # A whole batch of added/removed tracks is published as a single model reset
+        # so the view re-lays out once, a pure reorder (shuffle) is a layout change
+        if row_count_changed:
+            self.beginResetModel()
+            self._set_display_order(display_order)
+            self.endResetModel()
+        else:
+            self.layoutAboutToBeChanged.emit()
+            self._set_display_order(display_order)
+            self.layoutChanged.emit()
 
+        # Reset selection after the display update
+        self.display_order_changed.emit()
+
+    def _set_display_order(self, display_order: list[int]) -> None:
+        # Store the display order and rebuild the per-column display strings, so
+        # `data` only indexes into them instead of fetching and formatting a track
+        # for every painted cell
         self._display_order = display_order
 
-        self.layoutChanged.emit()
+        tracks = [
+            self._playlist_service.get_track_by_index(track_index)
+            for track_index in display_order
+        ]
 
-        # Reset selection after the display update
-        self.display_order_changed.emit()
+        self._display_columns = tuple(
+            [format_duration(track.duration) for track in tracks]
+            if column_name == "duration"
+            else [getattr(track, column_name) for track in tracks]
+            for column_name, _ in self.PLAYLIST_COLUMN
+        )
 
     def _update_active_row(self, position: int | None) -> None:
         # Sync playlist widget active row to the active track
@@ -1,4 +1,4 @@
-from PyQt6.QtCore import QModelIndex, QPointF, QRectF, Qt
+from PyQt6.QtCore import QModelIndex, QPointF, QRect, QRectF, Qt, pyqtSlot
 from PyQt6.QtGui import (
     QBrush,
     QColor,
@@ -13,34 +13,46 @@ from PyQt6.QtWidgets import (
     QHeaderView,
     QStyle,
     QStyledItemDelegate,
-    QStyleOptionViewItem,
     QTableView,
-    QTableWidget,
 )
 
 # ==================== CONSTANTS ====================
 ACTIVE_ROW_COLOR = "#2A3142"
 ACTIVE_ROW_TEXT_COLOR = "#00D9FF"
+ACTIVE_ROW_BORDER_START_COLOR = "#A855F7"
+ACTIVE_ROW_BORDER_END_COLOR = "#00D9FF"
 HOVER_ROW_COLOR = "#1ABC9C"
 PLAYLIST_WIDGET_OBJ_NAME = "playlistTableView"
 
+# Parsed once at import and shared by every delegate and paint call
+ACTIVE_ROW_BRUSH = QBrush(QColor(ACTIVE_ROW_COLOR))
+ACTIVE_ROW_TEXT_BRUSH = QBrush(QColor(ACTIVE_ROW_TEXT_COLOR))
+ACTIVE_ROW_BORDER_START = QColor(ACTIVE_ROW_BORDER_START_COLOR)
+ACTIVE_ROW_BORDER_END = QColor(ACTIVE_ROW_BORDER_END_COLOR)
+HOVER_ROW_BRUSH = QBrush(QColor(HOVER_ROW_COLOR))
+
+# Style state flags checked for every painted cell, resolved once at import
+STATE_NO_FOCUS_MASK = ~QStyle.StateFlag.State_HasFocus
+STATE_SELECTED = QStyle.StateFlag.State_Selected
+
 
 # ==================== PLAYLIST ====================
 class PlaylistItemDelegate(QStyledItemDelegate):
     """Custom delegate for playlist rows with hover and active row highlighting."""
 
     def __init__(self, parent: QTableView):
-        super().__init__()
+        super().__init__(parent)
         self._parent = parent
+        self._viewport = parent.viewport()
 
         # Row state
         self._active_row = -1
         self._hover_row = -1
 
-        # Brush
-        self._active_row_brush = QBrush(QColor(ACTIVE_ROW_COLOR))
-        self._active_row_text_brush = QBrush(QColor(ACTIVE_ROW_TEXT_COLOR))
-        self._hover_row_brush = QBrush(QColor(HOVER_ROW_COLOR))
+        # Row palettes derived from the view palette, keyed by (hovered, active).
+        # Rebuilt only when the view palette itself changes
+        self._row_palettes: dict[tuple[bool, bool], QPalette] = {}
+        self._row_palettes_base_key: int | None = None
 
     # -- Public methods --
     #
@@ -72,74 +84,71 @@ class PlaylistItemDelegate(QStyledItemDelegate):
             self._update_row(row)
 
     # Parent methods
-    def paint(self, painter, option, index) -> None:
-        opt = QStyleOptionViewItem(option)  # Stores a copy of `option`
+    def initStyleOption(self, option, index) -> None:
+        # Adjust the option Qt builds for each cell, painting itself is left to Qt
+        super().initStyleOption(option, index)
 
         # Remove focus visuals (dotted outline or highlights)
-        opt.state &= ~QStyle.StateFlag.State_HasFocus
-        row_index = index.row()
-        selected = opt.state & QStyle.StateFlag.State_Selected
+        option.state &= STATE_NO_FOCUS_MASK
 
         # Row selected - highest priority (Qt default)
-        if selected:
-            super().paint(painter, opt, index)
-            # Draw border if selected row == active row
-            if row_index == self._active_row:
-                self._draw_active_row_border(painter, option, index)
+        if option.state & STATE_SELECTED:
             return
 
-        # Hover - second priority
-        if row_index == self._hover_row:
-            self._apply_highlight(opt, self._hover_row_brush)
-            # Apply text color if hover row == active row
-            if row_index == self._active_row:
-                opt.palette.setBrush(
-                    QPalette.ColorRole.Text,
-                    QBrush(QColor(self._active_row_text_brush)),
-                )
-
-        # Active row - lower priority
-        elif row_index == self._active_row:
-            opt.palette.setBrush(
-                QPalette.ColorRole.Text,
-                QBrush(QColor(self._active_row_text_brush)),
-            )
-            self._apply_highlight(opt, self._active_row_brush)
+        # Hover - second priority, active row - lower priority
+        row_index = index.row()
+        hovered = row_index == self._hover_row
+        active = row_index == self._active_row
+        if hovered or active:
+            option.palette = self._row_palette(option.palette, hovered, active)
+
+            # Treat as selected to highlight the row
+            option.state |= STATE_SELECTED
 
-        # Use the default behavior for the rest
-        super().paint(painter, opt, index)
+    def paint(self, painter, option, index) -> None:
+        super().paint(painter, option, index)
 
         # Draw border to the active row after painting
-        if row_index == self._active_row:
+        if index.row() == self._active_row:
             self._draw_active_row_border(painter, option, index)
 
     # -- Protected/Internal methods --
-    def _apply_highlight(self, opt, brush):
-        opt.palette.setBrush(QPalette.ColorRole.Highlight, brush)
-        opt.palette.setBrush(
+    def _row_palette(self, base: QPalette, hovered: bool, active: bool) -> QPalette:
+        # Return the cached palette for a hovered and/or active row, so `paint`
+        # doesn't copy and modify the view palette for every cell
+        base_key = base.cacheKey()
+        if base_key != self._row_palettes_base_key:
+            self._row_palettes.clear()
+            self._row_palettes_base_key = base_key
+
+        palette = self._row_palettes.get((hovered, active))
+        if palette is not None:
+            return palette
+
+        palette = QPalette(base)
+
+        # Active row text color, kept as is when the active row is also hovered
+        if active and not hovered:
+            palette.setBrush(QPalette.ColorRole.Text, ACTIVE_ROW_TEXT_BRUSH)
+
+        highlight = HOVER_ROW_BRUSH if hovered else ACTIVE_ROW_BRUSH
+        palette.setBrush(QPalette.ColorRole.Highlight, highlight)
+        palette.setBrush(
             QPalette.ColorRole.HighlightedText,
-            opt.palette.brush(QPalette.ColorRole.Text),
+            palette.brush(QPalette.ColorRole.Text),
         )
 
-        # Treat as selected to highlight the row
-        opt.state |= QStyle.StateFlag.State_Selected
+        if active and hovered:
+            palette.setBrush(QPalette.ColorRole.Text, ACTIVE_ROW_TEXT_BRUSH)
 
-    def _draw_active_row_border(self, painter, option, index):
-        view = self._parent
-        if view is None:
-            return
+        self._row_palettes[hovered, active] = palette
 
-        model = view.model()
-        if model is None:
-            return
-
-        row = index.row()
-
-        # Determine row's full span
-        left_index = model.index(row, 0)
-        right_index = model.index(row, model.columnCount() - 1)
+        return palette
 
-        rect = view.visualRect(left_index) | view.visualRect(right_index)
+    def _draw_active_row_border(self, painter, option, index):
+        rect = self._row_rect(index.row())
+        if rect is None:
+            return
 
         # Adjust for crisp borders (avoid clipping)
         rect.adjust(1, 1, -1, -1)
@@ -155,8 +164,8 @@ class PlaylistItemDelegate(QStyledItemDelegate):
 
         # Create gradient effect
         gradient = QLinearGradient(QPointF(rect.topLeft()), QPointF(rect.topRight()))
-        gradient.setColorAt(0, QColor("#A855F7"))
-        gradient.setColorAt(1, QColor("#00D9FF"))
+        gradient.setColorAt(0, ACTIVE_ROW_BORDER_START)
+        gradient.setColorAt(1, ACTIVE_ROW_BORDER_END)
 
         # Apply gradient to pen and draw border
         pen = QPen(QBrush(gradient), 2)
@@ -166,20 +175,26 @@ class PlaylistItemDelegate(QStyledItemDelegate):
         painter.restore()
 
     def _update_row(self, row: int) -> None:
-        if self._parent is None or row < 0:
+        if row < 0:
             return
 
+        rect = self._row_rect(row)
+        if rect is None:
+            return
+
+        # Repaint only the row's strip, not the whole viewport
+        self._viewport.update(rect)
+
+    def _row_rect(self, row: int) -> QRect | None:
+        # Return the row's full span (first to last column) in viewport coordinates
         model = self._parent.model()
         if model is None:
-            return
+            return None
 
-        # Get first and last index of the row (entire row)
         left = model.index(row, 0)
         right = model.index(row, model.columnCount() - 1)
 
-        rect = self._parent.visualRect(left) | self._parent.visualRect(right)
-
-        self._parent.viewport().update(rect)
+        return self._parent.visualRect(left) | self._parent.visualRect(right)
 
 
 class PlaylistWidget(QTableView):
@@ -228,10 +243,14 @@ class PlaylistWidget(QTableView):
         rows = self.verticalHeader()
         if rows is not None:
             rows.setDefaultSectionSize(50)
+
+            # Every row has the same fixed height, so the header never needs to
+            # measure rows from their contents
+            rows.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
             rows.hide()
 
         # Disable cell edit
-        self.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
         # Remove cell focus on click
         self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
@@ -240,7 +259,7 @@ class PlaylistWidget(QTableView):
         self.setShowGrid(False)
 
         # Select the entire row on click
-        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
 
         # Disable multi row selection
         self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
@@ -256,6 +275,7 @@ class PlaylistWidget(QTableView):
     def _connect_signals(self):
         self.entered.connect(self._on_table_mouse_hover)
 
+    @pyqtSlot(QModelIndex)
     def _on_table_mouse_hover(self, index: QModelIndex) -> None:
         """Update hover row when mouse enters a new row.
 
@@ -1,10 +1,17 @@
-from PyQt6.QtCore import Qt, pyqtSlot
+from PyQt6.QtCore import QSignalBlocker, Qt, pyqtSlot
 from PyQt6.QtWidgets import QHBoxLayout, QSlider, QWidget
 
+from pyqt6_music_player.core import LatestValueThrottle
+
 from .volume_viewmodel import VolumeViewModel
 from .volume_widgets import VolumeButton, VolumeLabel
 
+# ==================== CONSTANTS ====================
+VOLUME_PANEL_LAYOUT_SPACING = 5
+VOLUME_THROTTLE_INTERVAL_MS = 16  # Max rate of volume changes sent while dragging
+
 
+# ==================== PANELS ====================
 class VolumeControlsPanel(QWidget):
     """A QWidget container for grouping volume widgets.
 
@@ -22,6 +29,9 @@ class VolumeControlsPanel(QWidget):
         self._volume_slider = QSlider()
         self._volume_label = VolumeLabel()
 
+        # Volume throttle, dragging the slider changes its value on every step
+        self._volume_throttle = LatestValueThrottle(VOLUME_THROTTLE_INTERVAL_MS, self)
+
         # Setup
         self._init_ui()
         self._connect_signals()
@@ -31,11 +41,7 @@ class VolumeControlsPanel(QWidget):
         # Setup instance widgets and layout
         #
         # PANEL LAYOUT: Horizontal box
-        panel_layout = QHBoxLayout()
-
-        # LEFT WIDGET: Volume button
-
-        panel_layout.addWidget(self._volume_button)
+        panel_layout = QHBoxLayout(self)
 
         # MIDDLE WIDGET: Volume slider
         self._volume_slider.setOrientation(Qt.Orientation.Horizontal)
@@ -44,26 +50,33 @@ class VolumeControlsPanel(QWidget):
             self._viewmodel.max_volume,
         )  # Fetch range from viewmodel
 
-        panel_layout.addWidget(self._volume_slider)
+        # WIDGETS (left to right): Volume button, volume slider, and volume label
+        for widget in (self._volume_button, self._volume_slider, self._volume_label):
+            panel_layout.addWidget(widget)
 
-        # RIGHT WIDGET: Volume label
-        panel_layout.addWidget(self._volume_label)
-
-        panel_layout.setSpacing(5)
-
-        self.setLayout(panel_layout)
+        panel_layout.setSpacing(VOLUME_PANEL_LAYOUT_SPACING)
 
     def _connect_signals(self) -> None:
         # VolumeControlsPanel -> VolumeViewModel
-        self._volume_slider.valueChanged.connect(self._viewmodel.set_volume)
+        self._volume_slider.valueChanged.connect(self._volume_throttle.push)
+        # Apply the final value on release instead of waiting for the throttle
+        self._volume_slider.sliderReleased.connect(self._volume_throttle.flush)
         self._volume_button.toggled.connect(self._viewmodel.set_mute)
 
+        # Volume throttle -> VolumeControlsPanel
+        self._volume_throttle.flushed.connect(self._on_volume_throttled)
+
         # VolumeViewModel -> VolumeControlsPanel
         self._viewmodel.volume_changed.connect(self._on_volume_changed)
 
         # Initial Startup Sync: Read initial state from ViewModel
         self._on_volume_changed(self._viewmodel.current_volume)
 
+    @pyqtSlot(object)
+    def _on_volume_throttled(self, volume: int) -> None:
+        # `flushed` carries a plain object, `set_volume` is an int slot
+        self._viewmodel.set_volume(int(volume))
+
     @pyqtSlot(int)
     def _on_volume_changed(self, new_volume: int) -> None:
         # Update volume button
@@ -81,12 +94,11 @@ class VolumeControlsPanel(QWidget):
         # Icon
         self._volume_button.update_icon(new_volume)
 
-        # Toggle state
-        self._volume_button.blockSignals(True)
-        self._volume_button.setChecked(is_muted)
-        self._volume_button.blockSignals(False)
+        # Toggle state, without echoing it back to the viewmodel
+        with QSignalBlocker(self._volume_button):
+            self._volume_button.setChecked(is_muted)
 
     def _update_slider(self, new_volume: int) -> None:
-        self._volume_slider.blockSignals(True)
-        self._volume_slider.setValue(new_volume)
-        self._volume_slider.blockSignals(False)
+        # Move the slider without echoing the value back to the viewmodel
+        with QSignalBlocker(self._volume_slider):
+            self._volume_slider.setValue(new_volume)
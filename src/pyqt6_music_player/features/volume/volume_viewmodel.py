@@ -1,6 +1,6 @@
 import logging
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from .volume import Volume
 
@@ -32,7 +32,8 @@ class VolumeViewModel(QObject):
     def max_volume(self) -> int:
         return self._model.max_volume
 
-    def set_volume(self, new_volume) -> None:
+    @pyqtSlot(int)
+    def set_volume(self, new_volume: int) -> None:
         """Set the volume.
 
         Args:
@@ -41,6 +42,7 @@ class VolumeViewModel(QObject):
         """
         self._model.set_volume(new_volume)
 
+    @pyqtSlot(bool)
     def set_mute(self, mute: bool) -> None:
         """Set the mute state.
 
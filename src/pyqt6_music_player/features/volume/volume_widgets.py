@@ -1,10 +1,10 @@
+from bisect import bisect_right
 from pathlib import Path
 
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QLabel
 
-from pyqt6_music_player.core import ASSETS_PATH, IconButton
+from pyqt6_music_player.core import ASSETS_PATH, IconButton, load_icon
 
 # ==================== CONSTANTS ====================
 HIGH_VOLUME_ICON = ASSETS_PATH / "volume_high.svg"
@@ -13,6 +13,13 @@ LOW_VOLUME_ICON = ASSETS_PATH / "volume_low.svg"
 MUTED_VOLUME_ICON = ASSETS_PATH / "volume_muted.svg"
 VOLUME_BTN_SIZE = (30, 30)
 VOLUME_BTN_ICON_SIZE = (15, 15)
+VOLUME_ICON_THRESHOLDS = (1, 34, 67)  # Min volume for the low, medium, and high icon
+VOLUME_ICONS = (
+    MUTED_VOLUME_ICON,
+    LOW_VOLUME_ICON,
+    MEDIUM_VOLUME_ICON,
+    HIGH_VOLUME_ICON,
+)  # Indexed by the number of thresholds reached
 
 
 # ==================== WIDGETS ====================
@@ -56,24 +63,14 @@ class VolumeButton(IconButton):
             new_volume: The new volume.
 
         """
-        high_threshold = 67
-        medium_threshold = 34
-        low_threshold = 1
-
-        if new_volume >= high_threshold:
-            icon = HIGH_VOLUME_ICON
-        elif new_volume >= medium_threshold:
-            icon = MEDIUM_VOLUME_ICON
-        elif new_volume >= low_threshold:
-            icon = LOW_VOLUME_ICON
-        else:
-            icon = MUTED_VOLUME_ICON
+        # Number of thresholds reached picks the icon (muted, low, medium, high)
+        icon = VOLUME_ICONS[bisect_right(VOLUME_ICON_THRESHOLDS, new_volume)]
 
         # Update icon only if it is new
         if icon == self._current_icon:
             return
 
-        self.setIcon(QIcon(str(icon)))
+        self.setIcon(load_icon(icon))
 
         self._current_icon = icon
 
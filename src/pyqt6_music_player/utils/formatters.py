@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+
 def format_duration(duration: int | float) -> str:
     """Convert seconds to (HH:MM:SS) format string.
 
@@ -8,12 +11,17 @@ def format_duration(duration: int | float) -> str:
         Formatted time string in HH:MM:SS format (e.g., "01:23:45").
 
     """
-    duration = int(duration)
+    # Truncate before the cache lookup so every float within the same second
+    # shares one cache entry
+    return _format_seconds(int(duration))
+
+
+@lru_cache(maxsize=8192)
+def _format_seconds(duration: int) -> str:
     secs_in_hr = 3600
     secs_in_min = 60
 
     hours, remainder = divmod(duration, secs_in_hr)
     minutes, seconds = divmod(remainder, secs_in_min)
 
-
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
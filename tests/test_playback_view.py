@@ -0,0 +1,41 @@
+from unittest.mock import call
+
+from pyqt6_music_player.features.playback import (
+    PlaybackProgressPanel,
+    PlaybackService,
+    PlaybackViewModel,
+)
+
+
+def make_panel(qtbot, mocker):
+    service = mocker.Mock(spec=PlaybackService)
+    panel = PlaybackProgressPanel(PlaybackViewModel(service))
+    qtbot.addWidget(panel)
+
+    panel.seek_bar.setRange(0, 10_000)
+
+    return panel, service
+
+
+def test_dragged_seek_position_reaches_service_after_throttle(qtbot, mocker):
+    panel, service = make_panel(qtbot, mocker)
+
+    for position in (100, 200, 300):
+        panel.seek_bar.sliderMoved.emit(position)
+
+    qtbot.waitUntil(lambda: service.seek.called, timeout=1000)
+
+    assert service.seek.call_args_list == [call(300)]
+
+
+def test_slider_release_drops_throttled_position(qtbot, mocker):
+    panel, service = make_panel(qtbot, mocker)
+
+    panel.seek_bar.setValue(2000)
+    panel.seek_bar.sliderMoved.emit(500)
+    panel.seek_bar.sliderReleased.emit()
+
+    # Give the cancelled throttle time to fire if it was still running
+    qtbot.wait(50)
+
+    assert service.seek.call_args_list == [call(2000)]
@@ -0,0 +1,48 @@
+from pyqt6_music_player.core import LatestValueThrottle
+
+
+def test_emits_only_latest_value_when_interval_ends(qtbot):
+    throttle = LatestValueThrottle(interval_ms=10)
+    received = []
+    throttle.flushed.connect(received.append)
+
+    with qtbot.waitSignal(throttle.flushed, timeout=1000):
+        for value in (1, 2, 3):
+            throttle.push(value)
+
+    assert received == [3]
+
+
+def test_flush_emits_pending_value_immediately(qtbot):
+    throttle = LatestValueThrottle(interval_ms=10_000)
+    received = []
+    throttle.flushed.connect(received.append)
+
+    throttle.push(5)
+    throttle.flush()
+
+    assert received == [5]
+
+
+def test_flush_without_pending_value_does_not_emit(qtbot):
+    throttle = LatestValueThrottle(interval_ms=10)
+    received = []
+    throttle.flushed.connect(received.append)
+
+    throttle.flush()
+
+    assert received == []
+
+
+def test_cancel_drops_pending_value(qtbot):
+    throttle = LatestValueThrottle(interval_ms=10)
+    received = []
+    throttle.flushed.connect(received.append)
+
+    throttle.push(7)
+    throttle.cancel()
+
+    with qtbot.assertNotEmitted(throttle.flushed, wait=50):
+        pass
+
+    assert received == []
@@ -0,0 +1,31 @@
+from pyqt6_music_player.features.volume import (
+    Volume,
+    VolumeControlsPanel,
+    VolumeViewModel,
+)
+
+
+def make_panel(qtbot) -> tuple[VolumeControlsPanel, Volume]:
+    volume = Volume()
+    panel = VolumeControlsPanel(VolumeViewModel(volume))
+    qtbot.addWidget(panel)
+
+    return panel, volume
+
+
+def test_dragged_volume_reaches_model_after_throttle(qtbot):
+    panel, volume = make_panel(qtbot)
+
+    for value in (70, 50, 40):
+        panel._volume_slider.setValue(value)
+
+    qtbot.waitUntil(lambda: volume.current_volume == 40, timeout=1000)
+
+
+def test_slider_release_applies_volume_immediately(qtbot):
+    panel, volume = make_panel(qtbot)
+
+    panel._volume_slider.setValue(25)
+    panel._volume_slider.sliderReleased.emit()
+
+    assert volume.current_volume == 25